@@ -34,6 +34,7 @@ CONF_MAX_CONSECUTIVE_FAILS = "max_consecutive_fails"
 CONF_TIME_BEFORE_SLEEP = "time_before_sleep_ms"
 CONF_DELAY_BEFORE_IRQ = "delay_before_irq_ms"
 CONF_FINGER_SCAN_INTERVAL = "finger_scan_interval_ms"
+ICON_CONFIG = "mdi:cog"
 INITIAL_PASSWORD = "0"
 CFG_UART_BAUDRATE_9600 = 1
 CFG_UART_BAUDRATE_19200 = 2
@@ -48,6 +49,7 @@ UART_BAUDRATE_OPTIONS = {
     "115200": CFG_UART_BAUDRATE_115200,
     "921600": CFG_UART_BAUDRATE_921600,
 }
+validate_uart_baudrate = cv.enum(UART_BAUDRATE_OPTIONS)
 
 fingerprint_FPC2532_ns = cg.esphome_ns.namespace("fingerprint_FPC2532")
 FingerprintFPC2532Component = fingerprint_FPC2532_ns.class_(
@@ -88,7 +90,7 @@ CancelEnrollmentAction = fingerprint_FPC2532_ns.class_(
 )
 DeleteAction = fingerprint_FPC2532_ns.class_("DeleteAction", automation.Action)
 
-CONFIG_SCHEMA = cv.All(
+CONFIG_SCHEMA = (
     cv.Schema(
         {
             cv.GenerateID(): cv.declare_id(FingerprintFPC2532Component),
@@ -100,9 +102,7 @@ CONFIG_SCHEMA = cv.All(
             cv.Optional(CONF_UART_IRQ_BEFORE_TX, default=True): cv.boolean,
             cv.Optional(CONF_STATUS_AT_BOOT, default=True): cv.boolean,
             cv.Optional(CONF_STOP_MODE_UART, default=False): cv.boolean,
-            cv.Optional(CONF_UART_BAUDRATE, default="921600"): cv.enum(
-                UART_BAUDRATE_OPTIONS
-            ),
+            cv.Optional(CONF_UART_BAUDRATE, default="921600"): validate_uart_baudrate,
             cv.Optional(CONF_MAX_CONSECUTIVE_FAILS, default=5): cv.uint8_t,
             cv.Optional(
                 CONF_TIME_BEFORE_SLEEP, default="0ms"
@@ -170,87 +170,48 @@ CONFIG_SCHEMA = cv.All(
 )
 
 
+_SETTERS = (
+    (CONF_PASSWORD, "set_password"),
+    (CONF_LOCKOUT_TIME, "set_lockout_time_s"),
+    (CONF_FINGER_SCAN_INTERVAL, "set_finger_scan_interval_ms"),
+    (CONF_DELAY_BEFORE_IRQ, "set_delay_before_irq_ms"),
+    (CONF_TIME_BEFORE_SLEEP, "set_time_before_sleep_ms"),
+    (CONF_MAX_CONSECUTIVE_FAILS, "set_max_consecutive_fails"),
+    (CONF_UART_BAUDRATE, "set_uart_baudrate"),
+    (CONF_STOP_MODE_UART, "set_stop_mode_uart"),
+    (CONF_STATUS_AT_BOOT, "set_status_at_boot"),
+    (CONF_UART_IRQ_BEFORE_TX, "set_uart_irq_before_tx"),
+    (CONF_ENROLL_TIMEOUT, "set_enroll_timeout_ms"),
+)
+
+# CONF_ON_FINGER_SCAN_INVALID is accepted by the schema but not wired up yet
+_TRIGGERS = (
+    (CONF_ON_FINGER_SCAN_START, ()),
+    (CONF_ON_FINGER_SCAN_MATCHED, ((cg.uint16, "finger_id"), (cg.uint16, "tag"))),
+    (CONF_ON_FINGER_SCAN_UNMATCHED, ()),
+    (CONF_ON_ENROLLMENT_SCAN, ((cg.uint16, "finger_id"),)),
+    (CONF_ON_ENROLLMENT_DONE, ((cg.uint16, "finger_id"),)),
+    (CONF_ON_ENROLLMENT_FAILED, ((cg.uint16, "finger_id"),)),
+)
+
+
 async def to_code(config):
     var = cg.new_Pvariable(config[CONF_ID])
     await cg.register_component(var, config)
-    if CONF_PASSWORD in config:
-        password = config[CONF_PASSWORD]
-        cg.add(var.set_password(password))
     await uart.register_uart_device(var, config)
 
-    if CONF_LOCKOUT_TIME in config:
-        lockout_time_s = config[CONF_LOCKOUT_TIME]
-        cg.add(var.set_lockout_time_s(lockout_time_s))
-
-    if CONF_FINGER_SCAN_INTERVAL in config:
-        finger_scan_interval_ms = config[CONF_FINGER_SCAN_INTERVAL]
-        cg.add(var.set_finger_scan_interval_ms(finger_scan_interval_ms))
-
-    if CONF_DELAY_BEFORE_IRQ in config:
-        delay_before_irq_ms = config[CONF_DELAY_BEFORE_IRQ]
-        cg.add(var.set_delay_before_irq_ms(delay_before_irq_ms))
-
-    if CONF_TIME_BEFORE_SLEEP in config:
-        time_before_sleep_ms = config[CONF_TIME_BEFORE_SLEEP]
-        cg.add(var.set_time_before_sleep_ms(time_before_sleep_ms))
-
-    if CONF_MAX_CONSECUTIVE_FAILS in config:
-        max_consecutive_fails = config[CONF_MAX_CONSECUTIVE_FAILS]
-        cg.add(var.set_max_consecutive_fails(max_consecutive_fails))
-
-    if CONF_UART_BAUDRATE in config:
-        uart_baudrate = config[CONF_UART_BAUDRATE]
-        cg.add(var.set_uart_baudrate(uart_baudrate))
-
-    if CONF_STOP_MODE_UART in config:
-        stop_mode_uart = config[CONF_STOP_MODE_UART]
-        cg.add(var.set_stop_mode_uart(stop_mode_uart))
-
-    if CONF_STATUS_AT_BOOT in config:
-        status_at_boot = config[CONF_STATUS_AT_BOOT]
-        cg.add(var.set_status_at_boot(status_at_boot))
-
-    if CONF_UART_IRQ_BEFORE_TX in config:
-        uart_irq_before_tx = config[CONF_UART_IRQ_BEFORE_TX]
-        cg.add(var.set_uart_irq_before_tx(uart_irq_before_tx))
+    for key, setter in _SETTERS:
+        if key in config:
+            cg.add(getattr(var, setter)(config[key]))
 
     if CONF_SENSOR_POWER_PIN in config:
         sensor_power_pin = await cg.gpio_pin_expression(config[CONF_SENSOR_POWER_PIN])
         cg.add(var.set_sensor_power_pin(sensor_power_pin))
 
-    if CONF_ENROLL_TIMEOUT in config:
-        enroll_timeout_ms = config[CONF_ENROLL_TIMEOUT]
-        cg.add(var.set_enroll_timeout_ms(enroll_timeout_ms))
-
-    for conf in config.get(CONF_ON_FINGER_SCAN_START, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [], conf)
-
-    for conf in config.get(CONF_ON_FINGER_SCAN_MATCHED, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(
-            trigger, [(cg.uint16, "finger_id"), (cg.uint16, "tag")], conf
-        )
-
-    for conf in config.get(CONF_ON_FINGER_SCAN_UNMATCHED, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [], conf)
-    """
-    for conf in config.get(CONF_ON_FINGER_SCAN_INVALID, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [(cg.uint16, "capture_error")], conf)
-    """
-    for conf in config.get(CONF_ON_ENROLLMENT_SCAN, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [(cg.uint16, "finger_id")], conf)
-
-    for conf in config.get(CONF_ON_ENROLLMENT_DONE, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [(cg.uint16, "finger_id")], conf)
-
-    for conf in config.get(CONF_ON_ENROLLMENT_FAILED, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [(cg.uint16, "finger_id")], conf)
+    for key, args in _TRIGGERS:
+        for conf in config.get(key, ()):
+            trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
+            await automation.build_automation(trigger, list(args), conf)
 
 
 @automation.register_action(
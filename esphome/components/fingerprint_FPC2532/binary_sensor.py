@@ -3,18 +3,26 @@ from esphome.components import binary_sensor
 import esphome.config_validation as cv
 from esphome.const import ENTITY_CATEGORY_DIAGNOSTIC
 
-from . import CONF_FINGERPRINT_FPC2532_ID, FingerprintFPC2532Component
+from . import (
+    CONF_FINGERPRINT_FPC2532_ID,
+    CONF_STATUS_AT_BOOT,
+    CONF_STOP_MODE_UART,
+    CONF_UART_IRQ_BEFORE_TX,
+    ICON_CONFIG,
+    FingerprintFPC2532Component,
+)
 
-CONF_SET_STATUS_AT_BOOT = "status_at_boot"
-CONF_STOP_MODE_UART = "stop_mode_uart"
-CONF_UART_IRQ_BEFORE_TX = "uart_irq_before_tx"
 CONF_ENROLLING = "enrolling_binary"
 
-ICON_CONFIG = "mdi:cog"
 ICON_ENROLL = "mdi:key-plus"
 
 DEPENDENCIES = ["fingerprint_FPC2532"]
 
+_CONFIG_BINARY_SENSOR_SCHEMA = binary_sensor.binary_sensor_schema(
+    icon=ICON_CONFIG,
+    entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+)
+
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(CONF_FINGERPRINT_FPC2532_ID): cv.use_id(
@@ -23,37 +31,24 @@ CONFIG_SCHEMA = cv.Schema(
         cv.Optional(CONF_ENROLLING): binary_sensor.binary_sensor_schema(
             icon=ICON_ENROLL,
         ),
-        cv.Optional(CONF_UART_IRQ_BEFORE_TX): binary_sensor.binary_sensor_schema(
-            icon=ICON_CONFIG,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_SET_STATUS_AT_BOOT): binary_sensor.binary_sensor_schema(
-            icon=ICON_CONFIG,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_STOP_MODE_UART): binary_sensor.binary_sensor_schema(
-            icon=ICON_CONFIG,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
+        cv.Optional(CONF_UART_IRQ_BEFORE_TX): _CONFIG_BINARY_SENSOR_SCHEMA,
+        cv.Optional(CONF_STATUS_AT_BOOT): _CONFIG_BINARY_SENSOR_SCHEMA,
+        cv.Optional(CONF_STOP_MODE_UART): _CONFIG_BINARY_SENSOR_SCHEMA,
     }
 )
 
+_SETTERS = (
+    (CONF_ENROLLING, "set_enrolling_binary_sensor"),
+    (CONF_UART_IRQ_BEFORE_TX, "set_uart_irq_before_tx_binary_sensor"),
+    (CONF_STATUS_AT_BOOT, "set_status_at_boot_binary_sensor"),
+    (CONF_STOP_MODE_UART, "set_stop_mode_uart_binary_sensor"),
+)
+
 
 async def to_code(config):
     hub = await cg.get_variable(config[CONF_FINGERPRINT_FPC2532_ID])
 
-    if CONF_ENROLLING in config:
-        sens = await binary_sensor.new_binary_sensor(config[CONF_ENROLLING])
-        cg.add(hub.set_enrolling_binary_sensor(sens))
-
-    if CONF_UART_IRQ_BEFORE_TX in config:
-        sens = await binary_sensor.new_binary_sensor(config[CONF_UART_IRQ_BEFORE_TX])
-        cg.add(hub.set_uart_irq_before_tx_binary_sensor(sens))
-
-    if CONF_SET_STATUS_AT_BOOT in config:
-        sens = await binary_sensor.new_binary_sensor(config[CONF_SET_STATUS_AT_BOOT])
-        cg.add(hub.set_status_at_boot_binary_sensor(sens))
-
-    if CONF_STOP_MODE_UART in config:
-        sens = await binary_sensor.new_binary_sensor(config[CONF_STOP_MODE_UART])
-        cg.add(hub.set_stop_mode_uart_binary_sensor(sens))
+    for key, setter in _SETTERS:
+        if key in config:
+            sens = await binary_sensor.new_binary_sensor(config[key])
+            cg.add(getattr(hub, setter)(sens))
@@ -17,27 +17,29 @@ from esphome.const import (
     ICON_SECURITY,
 )
 
-from . import CONF_FINGERPRINT_FPC2532_ID, FingerprintFPC2532Component
-
-ICON_COG = "mdi:cog"
-CONF_SET_STATUS_AT_BOOT = "status_at_boot"
-CONF_STOP_MODE_UART = "stop_mode_uart"
-CONF_UART_IRQ_BEFORE_TX = "uart_irq_before_tx"
+from . import (
+    CONF_FINGERPRINT_FPC2532_ID,
+    CONF_LOCKOUT_TIME,
+    ICON_CONFIG,
+    FingerprintFPC2532Component,
+)
 
 CONF_ENROLLMENT_FEEDBACK = "enrollment_feedback"
 ICON_FEEDBACK = "mdi:message-alert-outline"
-ICON_CONFIG = "mdi:settings"
-CONF_LOCKOUT_TIME = "lockout_time_s"
 CONF_LOCKOUT_AFTER_NR_OF_FAILS = "lockout_after_nr_of_fails"
 CONF_IDLE_TIME_BEFORE_SLEEP = "idle_time_before_sleep_ms"
 CONF_UART_DLY_BEFORE_TX = "uart_dly_before_tx_ms"
 CONF_SCAN_INTERVAL = "scan_interval_ms"
 CONF_BAUD_RATE = "baud_rate"
 
-VALID_BAUD_RATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
-
 DEPENDENCIES = ["fingerprint_FPC2532"]
 
+_CONFIG_SENSOR_SCHEMA = sensor.sensor_schema(
+    icon=ICON_CONFIG,
+    accuracy_decimals=0,
+    entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+)
+
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(CONF_FINGERPRINT_FPC2532_ID): cv.use_id(
@@ -79,44 +81,19 @@ CONFIG_SCHEMA = cv.Schema(
             accuracy_decimals=0,
             entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
         ),
-        cv.Optional(CONF_SCAN_INTERVAL): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_UART_DLY_BEFORE_TX): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_IDLE_TIME_BEFORE_SLEEP): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_LOCKOUT_AFTER_NR_OF_FAILS): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_LOCKOUT_TIME): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
-        cv.Optional(CONF_BAUD_RATE): sensor.sensor_schema(
-            icon=ICON_COG,
-            accuracy_decimals=0,
-            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
-        ),
+        cv.Optional(CONF_SCAN_INTERVAL): _CONFIG_SENSOR_SCHEMA,
+        cv.Optional(CONF_UART_DLY_BEFORE_TX): _CONFIG_SENSOR_SCHEMA,
+        cv.Optional(CONF_IDLE_TIME_BEFORE_SLEEP): _CONFIG_SENSOR_SCHEMA,
+        cv.Optional(CONF_LOCKOUT_AFTER_NR_OF_FAILS): _CONFIG_SENSOR_SCHEMA,
+        cv.Optional(CONF_LOCKOUT_TIME): _CONFIG_SENSOR_SCHEMA,
+        cv.Optional(CONF_BAUD_RATE): _CONFIG_SENSOR_SCHEMA,
     }
 )
 
 
-async def to_code(config):
-    hub = await cg.get_variable(config[CONF_FINGERPRINT_FPC2532_ID])
-
-    for key in [
+_SETTERS = {
+    key: f"set_{key}_sensor"
+    for key in (
         CONF_FINGERPRINT_COUNT,
         CONF_STATUS,
         CONF_CAPACITY,
@@ -131,19 +108,16 @@ async def to_code(config):
         CONF_LOCKOUT_AFTER_NR_OF_FAILS,
         CONF_LOCKOUT_TIME,
         CONF_BAUD_RATE,
-    ]:
-        if key not in config:
-            continue
-        conf = config[key]
-        sens = await sensor.new_sensor(conf)
-        cg.add(getattr(hub, f"set_{key}_sensor")(sens))
+    )
+}
 
 
-"""
-    for key in [CONF_UART_IRQ_BEFORE_TX, CONF_STOP_MODE_UART, CONF_SET_STATUS_AT_BOOT]:
-        if key not in config:
-            continue
-        conf = config[key]
-        sens = await binary_sensor.new_sensor(conf)
-        cg.add(getattr(hub, f"set_{key}_sensor")(sens))
-"""
+async def to_code(config):
+    hub = await cg.get_variable(config[CONF_FINGERPRINT_FPC2532_ID])
+
+    # Codegen runs on ESPHome's deterministic coroutine scheduler, not asyncio,
+    # so sensors are awaited in config order to keep main.cpp stable.
+    for key, conf in config.items():
+        if (setter := _SETTERS.get(key)) is not None:
+            sens = await sensor.new_sensor(conf)
+            cg.add(getattr(hub, setter)(sens))
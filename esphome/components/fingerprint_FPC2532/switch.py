@@ -3,37 +3,38 @@ from esphome.components import switch
 import esphome.config_validation as cv
 from esphome.const import CONF_ICON, CONF_ID
 
-from . import CONF_FINGERPRINT_FPC2532_ID, FingerprintFPC2532Component
-
-CONF_SENSOR_POWER_PIN = "sensor_power_pin"
-CONF_SET_STATUS_AT_BOOT = "status_at_boot"
-CONF_STOP_MODE_UART = "stop_mode_uart"
-CONF_UART_IRQ_BEFORE_TX = "uart_irq_before_tx"
-ICON_CONFIG = "mdi:cog"
+from . import (
+    CONF_FINGERPRINT_FPC2532_ID,
+    CONF_STATUS_AT_BOOT,
+    CONF_STOP_MODE_UART,
+    CONF_UART_IRQ_BEFORE_TX,
+    ICON_CONFIG,
+    FingerprintFPC2532Component,
+    fingerprint_FPC2532_ns,
+)
 
 DEPENDENCIES = ["fingerprint_FPC2532"]
 
+_CONFIG_ICON_IDS = frozenset(
+    (CONF_STATUS_AT_BOOT, CONF_STOP_MODE_UART, CONF_UART_IRQ_BEFORE_TX)
+)
+
+_SETTERS = {key: f"set_{key}_switch" for key in _CONFIG_ICON_IDS}
+
 
 def validate_icons(config):
-    sensor_id = str(config[CONF_ID])
-    config_icon_group = {
-        CONF_SET_STATUS_AT_BOOT,
-        CONF_STOP_MODE_UART,
-        CONF_UART_IRQ_BEFORE_TX,
-    }
-    if sensor_id in config_icon_group:
-        icon = ICON_CONFIG
-    else:
-        icon = "mdi:checkbox-blank-outline"
-    return icon
-
-
-# Reference the embedded C++ class
-FingerprintSwitch = (
-    cg.global_ns.namespace("esphome")
-    .namespace("fingerprint_FPC2532")
-    .class_("FingerprintSwitch", switch.Switch)
-)
+    if str(config[CONF_ID]) in _CONFIG_ICON_IDS:
+        return ICON_CONFIG
+    return "mdi:checkbox-blank-outline"
+
+
+def set_default_icon(config):
+    if CONF_ICON not in config:
+        config[CONF_ICON] = validate_icons(config)
+    return config
+
+
+FingerprintSwitch = fingerprint_FPC2532_ns.class_("FingerprintSwitch", switch.Switch)
 
 CONFIG_SCHEMA = cv.All(
     switch.switch_schema(FingerprintSwitch).extend(
@@ -43,14 +44,14 @@ CONFIG_SCHEMA = cv.All(
             ),
         }
     ),
+    set_default_icon,
 )
 
 
 async def to_code(config):
     hub = await cg.get_variable(config[CONF_FINGERPRINT_FPC2532_ID])
     sw = await switch.new_switch(config)
-    if CONF_ICON not in config:
-        icon = validate_icons(config)
-        cg.add(sw.set_icon(icon))
     # cg.add(sw.set_entity_category(ENTITY_CATEGORY_CONFIG))
-    cg.add(getattr(hub, f"set_{config[CONF_ID]}_switch")(sw))
+    switch_id = str(config[CONF_ID])
+    setter = _SETTERS.get(switch_id) or f"set_{switch_id}_switch"
+    cg.add(getattr(hub, setter)(sw))
@@ -12,27 +12,41 @@ ICON_INFO = "mdi:information"
 
 DEPENDENCIES = ["fingerprint_FPC2532"]
 
+_SETTERS = {
+    key: f"set_{key}_sensor" for key in (CONF_STATUS_TEXT, CONF_UNIQUE_ID, CONF_VERSION)
+}
 
-def validate_icons(config):
+
+def validate_id(config):
     sensor_id = str(config[CONF_ID])
-    config_icon_group = {CONF_STATUS_TEXT, CONF_UNIQUE_ID, CONF_VERSION}
-    return ICON_INFO if sensor_id in config_icon_group else "mdi:checkbox-blank-outline"
+    if sensor_id not in _SETTERS:
+        raise cv.Invalid(
+            f"id must be one of {', '.join(_SETTERS)}, got '{sensor_id}'",
+            path=[CONF_ID],
+        )
+    return config
 
 
-CONFIG_SCHEMA = text_sensor.text_sensor_schema().extend(
-    {
-        cv.GenerateID(CONF_FINGERPRINT_FPC2532_ID): cv.use_id(
-            FingerprintFPC2532Component
-        ),
-    }
+def set_default_icon(config):
+    if CONF_ICON not in config:
+        config[CONF_ICON] = ICON_INFO
+    return config
+
+
+CONFIG_SCHEMA = cv.All(
+    text_sensor.text_sensor_schema().extend(
+        {
+            cv.GenerateID(CONF_FINGERPRINT_FPC2532_ID): cv.use_id(
+                FingerprintFPC2532Component
+            ),
+        }
+    ),
+    validate_id,
+    set_default_icon,
 )
 
 
 async def to_code(config):
     hub = await cg.get_variable(config[CONF_FINGERPRINT_FPC2532_ID])
     sens = await text_sensor.new_text_sensor(config)
-    if CONF_ICON not in config:
-        icon = validate_icons(config)
-        cg.add(sens.set_icon(icon))
-
-    cg.add(getattr(hub, f"set_{config[CONF_ID]}_sensor")(sens))
+    cg.add(getattr(hub, _SETTERS[str(config[CONF_ID])])(sens))
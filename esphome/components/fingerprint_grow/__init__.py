@@ -250,6 +250,13 @@ async def to_code(config):
         await automation.build_automation(trigger, [(cg.uint16, "finger_id")], conf)
 
 
+FINGERPRINT_GROW_ACTION_SCHEMA = cv.Schema(
+    {
+        cv.GenerateID(): cv.use_id(FingerprintGrowComponent),
+    }
+)
+
+
 @automation.register_action(
     "fingerprint_grow.enroll",
     EnrollmentAction,
@@ -277,11 +284,7 @@ async def fingerprint_grow_enroll_to_code(config, action_id, template_arg, args)
 @automation.register_action(
     "fingerprint_grow.cancel_enroll",
     CancelEnrollmentAction,
-    cv.Schema(
-        {
-            cv.GenerateID(): cv.use_id(FingerprintGrowComponent),
-        }
-    ),
+    FINGERPRINT_GROW_ACTION_SCHEMA,
 )
 async def fingerprint_grow_cancel_enroll_to_code(config, action_id, template_arg, args):
     var = cg.new_Pvariable(action_id, template_arg)
@@ -312,11 +315,7 @@ async def fingerprint_grow_delete_to_code(config, action_id, template_arg, args)
 @automation.register_action(
     "fingerprint_grow.delete_all",
     DeleteAllAction,
-    cv.Schema(
-        {
-            cv.GenerateID(): cv.use_id(FingerprintGrowComponent),
-        }
-    ),
+    FINGERPRINT_GROW_ACTION_SCHEMA,
 )
 async def fingerprint_grow_delete_all_to_code(config, action_id, template_arg, args):
     var = cg.new_Pvariable(action_id, template_arg)
@@ -347,6 +346,15 @@ async def fingerprint_grow_led_control_to_code(config, action_id, template_arg,
     return var
 
 
+# State and color are enums but are passed through as uint8 like speed and count
+_AURA_LED_SETTERS = (
+    (CONF_STATE, "set_state"),
+    (CONF_SPEED, "set_speed"),
+    (CONF_COLOR, "set_color"),
+    (CONF_COUNT, "set_count"),
+)
+
+
 @automation.register_action(
     "fingerprint_grow.aura_led_control",
     AuraLEDControlAction,
@@ -366,7 +374,7 @@ async def fingerprint_grow_aura_led_control_to_code(
     var = cg.new_Pvariable(action_id, template_arg)
     await cg.register_parented(var, config[CONF_ID])
 
-    for key in [CONF_STATE, CONF_SPEED, CONF_COLOR, CONF_COUNT]:
+    for key, setter in _AURA_LED_SETTERS:
         template_ = await cg.templatable(config[key], args, cg.uint8)
-        cg.add(getattr(var, f"set_{key}")(template_))
+        cg.add(getattr(var, setter)(template_))
     return var
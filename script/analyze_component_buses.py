@@ -24,8 +24,10 @@ Example output:
 from __future__ import annotations
 
 import argparse
-from functools import lru_cache
+from collections import defaultdict
+from functools import cache, lru_cache
 import json
+import os
 from pathlib import Path
 import re
 import sys
@@ -47,10 +49,38 @@ PACKAGE_DEPENDENCIES = {
     "modbus": ["uart"],  # modbus packages include uart packages
     # Add more package dependencies here as needed
 }
+_PACKAGE_DEPENDENCY_SETS = {
+    pkg: frozenset(deps) for pkg, deps in PACKAGE_DEPENDENCIES.items()
+}
 
 # Bus types that can be defined directly in config files
 # Components defining these directly cannot be grouped (they create unique bus IDs)
 DIRECT_BUS_TYPES = ("i2c", "spi", "uart", "modbus")
+_DIRECT_BUS_TYPES_SET = frozenset(DIRECT_BUS_TYPES)
+
+# Tokens that can influence the analysis of a YAML file: bus keys, packages,
+# Extend/Remove tags and anything that pulls in another file. Files containing
+# none of these anywhere are skipped without a YAML parse.
+_ANALYSIS_TOKENS_RE = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in (
+            *DIRECT_BUS_TYPES,
+            "packages",
+            "!extend",
+            "!remove",
+            "!include",
+            "<<",
+        )
+    )
+)
+
+# Pattern to match $component_dir or ${component_dir} references
+# These indicate local file usage that prevents grouping
+_COMPONENT_DIR_RE = re.compile(rb"\$\{?component_dir\}?")
+
+# Matches test.<platform>.yaml file names and captures the platform
+_TEST_YAML_RE = re.compile(r"test\.(.+)\.yaml")
 
 # Signature for components with no bus requirements
 # These components can be merged with any other group
@@ -106,7 +136,8 @@ def get_common_bus_packages() -> frozenset[str]:
         return frozenset()
 
     # List all directories in common/ - these are the bus package names
-    return frozenset(d.name for d in COMMON_BUS_PATH.iterdir() if d.is_dir())
+    with os.scandir(COMMON_BUS_PATH) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_dir())
 
 
 def uses_local_file_references(component_dir: Path) -> bool:
@@ -126,13 +157,15 @@ def uses_local_file_references(component_dir: Path) -> bool:
         return False
 
     try:
-        content = common_yaml.read_text()
+        content = common_yaml.read_bytes()
     except Exception:  # pylint: disable=broad-exception-caught
         return False
 
-    # Pattern to match $component_dir or ${component_dir} references
-    # These indicate local file usage that prevents grouping
-    return bool(re.search(r"\$\{?component_dir\}?", content))
+    # Substring check first; most files never mention component_dir
+    # (bytes throughout, since only ASCII tokens are searched for)
+    if b"component_dir" not in content:
+        return False
+    return _COMPONENT_DIR_RE.search(content) is not None
 
 
 def is_platform_component(component_dir: Path) -> bool:
@@ -161,14 +194,16 @@ def is_platform_component(component_dir: Path) -> bool:
         return False
 
     try:
-        content = comp_init.read_text()
-        return "IS_PLATFORM_COMPONENT = True" in content
+        content = comp_init.read_bytes()
+        return b"IS_PLATFORM_COMPONENT = True" in content
     except Exception:  # pylint: disable=broad-exception-caught
         return False
 
 
 def _contains_extend_or_remove(data: Any) -> bool:
-    """Recursively check if data contains Extend or Remove objects.
+    """Check if data contains Extend or Remove objects.
+
+    Walks the structure iteratively and stops at the first match.
 
     Args:
         data: Parsed YAML data structure
@@ -176,18 +211,17 @@ def _contains_extend_or_remove(data: Any) -> bool:
     Returns:
         True if any Extend or Remove objects are found
     """
-    if isinstance(data, (Extend, Remove)):
-        return True
-
-    if isinstance(data, dict):
-        for value in data.values():
-            if _contains_extend_or_remove(value):
-                return True
-
-    if isinstance(data, list):
-        for item in data:
-            if _contains_extend_or_remove(item):
-                return True
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (Extend, Remove)):
+            return True
+        # isinstance rather than type() checks: the YAML loader returns dict
+        # and list subclasses
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
 
     return False
 
@@ -196,7 +230,8 @@ def analyze_yaml_file(yaml_file: Path) -> dict[str, Any]:
     """Load a YAML file once and extract all needed information.
 
     This loads the YAML file a single time and extracts all information needed
-    for component analysis, avoiding multiple file reads.
+    for component analysis, avoiding multiple file reads. Results are cached
+    per (path, mtime, size) so repeated scans in the same run skip the YAML parse.
 
     Args:
         yaml_file: Path to the YAML file to analyze
@@ -208,56 +243,79 @@ def analyze_yaml_file(yaml_file: Path) -> dict[str, Any]:
         - has_direct_bus_config: bool indicating if buses are defined directly (not via packages)
         - loaded: bool indicating if file was successfully loaded
     """
-    result = {
-        "buses": set(),
-        "has_extend_remove": False,
-        "has_direct_bus_config": False,
-        "loaded": False,
+    try:
+        st = yaml_file.stat()
+    except OSError:
+        buses, has_extend_remove, has_direct_bus_config, loaded = (
+            frozenset(),
+            False,
+            False,
+            False,
+        )
+    else:
+        buses, has_extend_remove, has_direct_bus_config, loaded = (
+            _analyze_yaml_file_cached(str(yaml_file), st.st_mtime_ns, st.st_size)
+        )
+
+    return {
+        "buses": set(buses),
+        "has_extend_remove": has_extend_remove,
+        "has_direct_bus_config": has_direct_bus_config,
+        "loaded": loaded,
     }
 
-    if not yaml_file.exists():
-        return result
+
+@cache
+def _analyze_yaml_file_cached(
+    yaml_path: str, mtime_ns: int, size: int
+) -> tuple[frozenset[str], bool, bool, bool]:
+    """Parse and analyze a YAML file, cached by path, modification time and size.
+
+    Args:
+        yaml_path: Path to the YAML file to analyze
+        mtime_ns: Modification time of the file, used only as part of the cache key
+        size: Size of the file, used only as part of the cache key
+
+    Returns:
+        Tuple of (buses, has_extend_remove, has_direct_bus_config, loaded)
+    """
+    yaml_file = Path(yaml_path)
+    try:
+        content = yaml_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        pass  # Let the YAML loader handle and report the error
+    else:
+        if not _ANALYSIS_TOKENS_RE.search(content):
+            return frozenset(), False, False, True
 
     try:
         data = yaml_util.load_yaml(yaml_file)
-        result["loaded"] = True
     except Exception:  # pylint: disable=broad-exception-caught
-        return result
+        return frozenset(), False, False, False
 
     # Check for Extend/Remove objects
-    result["has_extend_remove"] = _contains_extend_or_remove(data)
+    has_extend_remove = _contains_extend_or_remove(data)
+
+    if not isinstance(data, dict):
+        return frozenset(), has_extend_remove, False, True
 
     # Check if buses are defined directly (not via packages)
     # Components that define i2c, spi, uart, or modbus directly in test files
     # cannot be grouped because they create unique bus IDs
-    if isinstance(data, dict):
-        for bus_type in DIRECT_BUS_TYPES:
-            if bus_type in data:
-                result["has_direct_bus_config"] = True
-                break
+    has_direct_bus_config = not _DIRECT_BUS_TYPES_SET.isdisjoint(data)
 
     # Extract common bus packages
-    if not isinstance(data, dict) or "packages" not in data:
-        return result
-
-    packages = data["packages"]
+    packages = data.get("packages")
     if not isinstance(packages, dict):
-        return result
+        return frozenset(), has_extend_remove, has_direct_bus_config, True
 
     valid_buses = get_common_bus_packages()
-    for pkg_name in packages:
-        if pkg_name not in valid_buses:
-            continue
-        result["buses"].add(pkg_name)
-        # Add any package dependencies (e.g., modbus includes uart)
-        if pkg_name not in PACKAGE_DEPENDENCIES:
-            continue
-        for dep in PACKAGE_DEPENDENCIES[pkg_name]:
-            if dep not in valid_buses:
-                continue
-            result["buses"].add(dep)
+    buses = valid_buses.intersection(packages)
+    # Add any package dependencies (e.g., modbus includes uart)
+    for pkg_name in buses & _PACKAGE_DEPENDENCY_SETS.keys():
+        buses |= _PACKAGE_DEPENDENCY_SETS[pkg_name] & valid_buses
 
-    return result
+    return buses, has_extend_remove, has_direct_bus_config, True
 
 
 def analyze_component(component_dir: Path) -> tuple[dict[str, list[str]], bool, bool]:
@@ -281,7 +339,12 @@ def analyze_component(component_dir: Path) -> tuple[dict[str, list[str]], bool,
     has_direct_bus_config = False
 
     # Analyze all YAML files in the component directory
-    for yaml_file in component_dir.glob("*.yaml"):
+    with os.scandir(component_dir) as entries:
+        yaml_files = [
+            Path(entry.path) for entry in entries if entry.name.endswith(".yaml")
+        ]
+
+    for yaml_file in yaml_files:
         analysis = analyze_yaml_file(yaml_file)
 
         # Track if any file uses extend/remove
@@ -293,9 +356,9 @@ def analyze_component(component_dir: Path) -> tuple[dict[str, list[str]], bool,
             has_direct_bus_config = True
 
         # For test.*.yaml files, extract platform and buses
-        if yaml_file.name.startswith("test.") and yaml_file.suffix == ".yaml":
-            # Extract platform name (e.g., test.esp32-ard.yaml -> esp32-ard)
-            platform = yaml_file.stem.replace("test.", "")
+        # Extract platform name (e.g., test.esp32-ard.yaml -> esp32-ard)
+        if match := _TEST_YAML_RE.fullmatch(yaml_file.name):
+            platform = match.group(1)
             # Always add platform, even if it has no buses (empty list)
             # This allows grouping components that don't use any shared buses
             platform_buses[platform] = (
@@ -330,10 +393,12 @@ def analyze_all_components(
     non_groupable = set()
     direct_bus_components = set()
 
-    for component_dir in sorted(tests_dir.iterdir()):
-        if not component_dir.is_dir():
-            continue
+    # DirEntry.is_dir() uses the file type from the directory listing, so this
+    # avoids a stat() per entry
+    with os.scandir(tests_dir) as entries:
+        component_dirs = sorted(Path(entry.path) for entry in entries if entry.is_dir())
 
+    for component_dir in component_dirs:
         component_name = component_dir.name
         platform_buses, has_extend_remove, has_direct_bus_config = analyze_component(
             component_dir
@@ -374,18 +439,24 @@ def analyze_all_components(
 
 
 @lru_cache(maxsize=256)
-def _get_bus_configs(buses: tuple[str, ...]) -> frozenset[tuple[str, str]]:
-    """Map bus type to set of configs for that type.
+def _get_bus_type_map(buses: tuple[str, ...]) -> dict[str, frozenset[str]]:
+    """Map each base bus type to the set of configs used for it.
+
+    The returned dict is shared between callers through the cache and must
+    not be mutated.
 
     Args:
         buses: Tuple of bus package names (e.g., ("uart_9600", "i2c"))
 
     Returns:
-        Frozenset of (base_type, full_config) tuples
-        Example: frozenset({("uart", "uart_9600"), ("i2c", "i2c")})
+        Dictionary mapping base type to its configs
+        Example: {"uart": frozenset({"uart_9600"}), "i2c": frozenset({"i2c"})}
     """
-    # Split on underscore to get base type: "uart_9600" -> "uart", "i2c" -> "i2c"
-    return frozenset((bus.split("_", 1)[0], bus) for bus in buses)
+    bus_types: dict[str, set[str]] = {}
+    for bus in buses:
+        # Split on underscore to get base type: "uart_9600" -> "uart", "i2c" -> "i2c"
+        bus_types.setdefault(bus.split("_", 1)[0], set()).add(bus)
+    return {base_type: frozenset(configs) for base_type, configs in bus_types.items()}
 
 
 @lru_cache(maxsize=1024)
@@ -405,31 +476,14 @@ def are_buses_compatible(buses1: tuple[str, ...], buses2: tuple[str, ...]) -> bo
     Returns:
         True if buses can be merged without conflicts
     """
-    configs1 = _get_bus_configs(buses1)
-    configs2 = _get_bus_configs(buses2)
-
-    # Group configs by base type
-    bus_types1: dict[str, set[str]] = {}
-    for base_type, full_config in configs1:
-        if base_type not in bus_types1:
-            bus_types1[base_type] = set()
-        bus_types1[base_type].add(full_config)
-
-    bus_types2: dict[str, set[str]] = {}
-    for base_type, full_config in configs2:
-        if base_type not in bus_types2:
-            bus_types2[base_type] = set()
-        bus_types2[base_type].add(full_config)
-
-    # Check for conflicts: same bus type with different configs
-    for bus_type, configs in bus_types1.items():
-        if bus_type not in bus_types2:
-            continue  # No conflict - different bus types
-        # Same bus type - check if configs match
-        if configs != bus_types2[bus_type]:
-            return False  # Conflict - same bus type, different configs
+    bus_types1 = _get_bus_type_map(buses1)
+    bus_types2 = _get_bus_type_map(buses2)
 
-    return True  # No conflicts found
+    # Conflict: same bus type with different configs
+    return all(
+        bus_types2.get(bus_type, configs) == configs
+        for bus_type, configs in bus_types1.items()
+    )
 
 
 def merge_compatible_bus_groups(
@@ -456,7 +510,18 @@ def merge_compatible_bus_groups(
     merged_groups: dict[tuple[str, str], list[str]] = {}
     processed_keys: set[tuple[str, str]] = set()
 
-    for (platform1, sig1), comps1 in sorted(grouped_components.items()):
+    sorted_groups = sorted(grouped_components.items())
+
+    # Merge candidates as (signature, buses, components), bucketed by platform
+    # in sorted signature order, so the inner loop only visits groups that
+    # could actually be merged
+    candidates = defaultdict(list)
+    for (platform, sig), comps in sorted_groups:
+        if sig == NO_BUSES_SIGNATURE or sig.startswith(ISOLATED_SIGNATURE_PREFIX):
+            continue
+        candidates[platform].append((sig, tuple(sorted(sig.split("+"))), comps))
+
+    for (platform1, sig1), comps1 in sorted_groups:
         if (platform1, sig1) in processed_keys:
             continue
 
@@ -476,33 +541,29 @@ def merge_compatible_bus_groups(
 
         # Start with this group's components
         merged_comps: list[str] = list(comps1)
-        merged_sig: str = sig1
         processed_keys.add((platform1, sig1))
+        merged = False
 
         # Get buses for this group as tuple for caching
         buses1: tuple[str, ...] = tuple(sorted(sig1.split("+")))
 
         # Try to merge with other groups on same platform
-        for (platform2, sig2), comps2 in sorted(grouped_components.items()):
-            if (platform2, sig2) in processed_keys:
+        # (no-bus and isolated groups were never added as candidates)
+        for sig2, buses2, comps2 in candidates[platform1]:
+            if (platform1, sig2) in processed_keys:
                 continue
-            if platform2 != platform1:
-                continue  # Different platforms can't be merged
-            if sig2 == NO_BUSES_SIGNATURE:
-                continue  # Keep separate for flexible batch distribution
-            if sig2.startswith(ISOLATED_SIGNATURE_PREFIX):
-                continue  # Isolated components can't be merged
 
             # Check if buses are compatible
-            buses2: tuple[str, ...] = tuple(sorted(sig2.split("+")))
             if are_buses_compatible(buses1, buses2):
                 # Compatible! Merge this group
                 merged_comps.extend(comps2)
-                processed_keys.add((platform2, sig2))
-                # Update merged signature to include all unique buses
-                all_buses: set[str] = set(buses1) | set(buses2)
-                merged_sig = "+".join(sorted(all_buses))
-                buses1 = tuple(sorted(all_buses))  # Update for next iteration
+                processed_keys.add((platform1, sig2))
+                merged = True
+                # Update buses to include all unique buses for next iteration
+                buses1 = tuple(sorted(set(buses1).union(buses2)))
+
+        # Build the merged signature once from the final bus tuple
+        merged_sig = "+".join(buses1) if merged else sig1
 
         # Store merged group
         merged_groups[(platform1, merged_sig)] = merged_comps
@@ -510,6 +571,23 @@ def merge_compatible_bus_groups(
     return merged_groups
 
 
+@lru_cache(maxsize=1024)
+def _bus_signature(buses: tuple[str, ...]) -> str:
+    """Build the grouping signature for a tuple of bus package names.
+
+    Cached so components sharing the same buses reuse one signature string.
+
+    Args:
+        buses: Tuple of bus package names
+
+    Returns:
+        Signature string (e.g., "i2c+uart") or empty if no valid buses
+    """
+    # Only include valid bus types in signature
+    common_buses = get_common_bus_packages()
+    return "+".join(sorted(b for b in buses if b in common_buses))
+
+
 def create_grouping_signature(
     platform_buses: dict[str, list[str]], platform: str
 ) -> str:
@@ -526,17 +604,11 @@ def create_grouping_signature(
     Returns:
         Signature string (e.g., "i2c" or "uart") or empty if no valid buses
     """
-    buses = platform_buses.get(platform, [])
+    buses = platform_buses.get(platform)
     if not buses:
         return ""
 
-    # Only include valid bus types in signature
-    common_buses = get_common_bus_packages()
-    valid_buses = [b for b in buses if b in common_buses]
-    if not valid_buses:
-        return ""
-
-    return "+".join(sorted(valid_buses))
+    return _bus_signature(tuple(buses))
 
 
 def group_components_by_signature(
@@ -552,21 +624,13 @@ def group_components_by_signature(
         Dictionary mapping signature to list of component names
         Example: {"i2c+uart_19200": ["comp1", "comp2"], "spi": ["comp3"]}
     """
-    signature_groups: dict[str, list[str]] = {}
+    signature_groups: dict[str, list[str]] = defaultdict(list)
 
     for component_name, platform_buses in components.items():
-        if platform not in platform_buses:
-            continue
-
-        signature = create_grouping_signature(platform_buses, platform)
-        if not signature:
-            continue
-
-        if signature not in signature_groups:
-            signature_groups[signature] = []
-        signature_groups[signature].append(component_name)
+        if signature := create_grouping_signature(platform_buses, platform):
+            signature_groups[signature].append(component_name)
 
-    return signature_groups
+    return dict(signature_groups)
 
 
 def main() -> None:
@@ -646,16 +710,18 @@ def main() -> None:
         # JSON output
         print(json.dumps(components, indent=2))
     else:
-        # Human-readable output
+        # Human-readable output, collected and written in one call
+        lines: list[str] = []
         for component, platform_buses in sorted(components.items()):
             non_groupable_marker = (
                 " [NON-GROUPABLE]" if component in non_groupable else ""
             )
-            print(f"{component}{non_groupable_marker}:")
+            lines.append(f"{component}{non_groupable_marker}:")
             for platform, buses in sorted(platform_buses.items()):
                 bus_str = ", ".join(buses)
-                print(f"  {platform}: {bus_str}")
-        print()
+                lines.append(f"  {platform}: {bus_str}")
+        lines.append("")
+        print("\n".join(lines))
         print(f"Total components analyzed: {len(components)}")
         if non_groupable:
             print(f"Non-groupable components (use local files): {len(non_groupable)}")
@@ -13,11 +13,13 @@ import sys
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
+# Matches package names followed by version operators
+_REQUIREMENT_RE = re.compile(r"^([a-zA-Z0-9_-]+)(==|>=|<=|>|<|!=|~=)(.+)$")
+
 
 def read_file_lines(path: Path) -> list[str]:
     """Read lines from a file."""
-    with open(path) as f:
-        return f.readlines()
+    return path.read_text().splitlines(keepends=True)
 
 
 def parse_requirement_line(line: str) -> tuple[str, str] | None:
@@ -39,9 +41,7 @@ def parse_requirement_line(line: str) -> tuple[str, str] | None:
     if not parse_line:
         return None
 
-    # Use regex to extract package name
-    # This matches package names followed by version operators
-    match = re.match(r"^([a-zA-Z0-9_-]+)(==|>=|<=|>|<|!=|~=)(.+)$", parse_line)
+    match = _REQUIREMENT_RE.match(parse_line)
     if match:
         return (match.group(1), original_line)  # Return package name and original line
 
@@ -65,8 +65,7 @@ def get_clang_tidy_version_from_requirements(repo_root: Path | None = None) -> s
 
 def read_file_bytes(path: Path) -> bytes:
     """Read bytes from a file."""
-    with open(path, "rb") as f:
-        return f.read()
+    return path.read_bytes()
 
 
 def get_repo_root() -> Path:
@@ -120,8 +119,7 @@ def read_stored_hash(repo_root: Path | None = None) -> str | None:
 
 def write_file_content(path: Path, content: str) -> None:
     """Write content to a file."""
-    with open(path, "w") as f:
-        f.write(content)
+    path.write_text(content)
 
 
 def write_hash(hash_value: str, repo_root: Path | None = None) -> None:
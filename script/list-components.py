@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 import argparse
 from collections.abc import Callable
+from functools import cache
+import inspect
+import os
 from pathlib import Path
 import sys
 
@@ -16,34 +19,37 @@ from esphome.const import (
 from esphome.core import CORE
 from esphome.loader import ComponentManifest, get_component, get_platform
 
+_COMPONENT_PREFIXES = ("esphome/components/", "tests/components/")
+
 
 def filter_component_files(str):
-    return str.startswith("esphome/components/") | str.startswith("tests/components/")
+    return str.startswith(_COMPONENT_PREFIXES)
 
 
 def get_all_component_files() -> list[str]:
     """Get all component files from git."""
-    files = git_ls_files()
-    return list(filter(filter_component_files, files))
+    return [f for f in git_ls_files() if f.startswith(_COMPONENT_PREFIXES)]
 
 
 def extract_component_names_array_from_files_array(files):
-    components = []
+    # dict keeps first-seen order with O(1) membership checks
+    components = {}
     for file in files:
         file_parts = file.split("/")
         if len(file_parts) >= 4:
-            component_name = file_parts[2]
-            if component_name not in components:
-                components.append(component_name)
-    return components
+            components[file_parts[2]] = None
+    return list(components)
 
 
 def add_item_to_components_graph(components_graph, parent, child):
     if not parent.startswith("__") and parent != child:
-        if parent not in components_graph:
-            components_graph[parent] = []
-        if child not in components_graph[parent]:
-            components_graph[parent].append(child)
+        components_graph.setdefault(parent, set()).add(child)
+
+
+@cache
+def _takes_config(auto_load: Callable) -> bool:
+    """Return whether an AUTO_LOAD callable accepts a config parameter."""
+    return bool(inspect.signature(auto_load).parameters)
 
 
 def resolve_auto_load(
@@ -62,9 +68,7 @@ def resolve_auto_load(
     if not callable(auto_load):
         return auto_load
 
-    import inspect
-
-    if inspect.signature(auto_load).parameters:
+    if _takes_config(auto_load):
         return auto_load(config)
     return auto_load()
 
@@ -86,15 +90,17 @@ def create_components_graph():
     CORE.data[KEY_CORE] = TARGET_CONFIGURATIONS[0]
 
     components_graph = {}
-    platforms = []
-    components: list[tuple[ComponentManifest, str, Path]] = []
+    platforms: set[str] = set()
+    components: list[tuple[ComponentManifest, str, str]] = []
 
-    for path in components_dir.iterdir():
-        if not path.is_dir():
-            continue
-        if not (path / "__init__.py").is_file():
+    with os.scandir(components_dir) as entries:
+        component_entries = [entry for entry in entries if entry.is_dir()]
+
+    for entry in component_entries:
+        path = entry.path
+        if not os.path.isfile(os.path.join(path, "__init__.py")):
             continue
-        name = path.name
+        name = entry.name
         comp = get_component(name)
         if comp is None:
             print(
@@ -104,9 +110,7 @@ def create_components_graph():
 
         components.append((comp, name, path))
         if comp.is_platform_component:
-            platforms.append(name)
-
-    platforms = set(platforms)
+            platforms.add(name)
 
     for comp, name, path in components:
         for dependency in comp.dependencies:
@@ -114,15 +118,22 @@ def create_components_graph():
                 components_graph, dependency.split(".")[0], name
             )
 
-        for target_config in TARGET_CONFIGURATIONS:
-            CORE.data[KEY_CORE] = target_config
-            for item in resolve_auto_load(comp.auto_load, config=None):
+        if callable(comp.auto_load):
+            for target_config in TARGET_CONFIGURATIONS:
+                CORE.data[KEY_CORE] = target_config
+                for item in resolve_auto_load(comp.auto_load, config=None):
+                    add_item_to_components_graph(components_graph, item, name)
+            # restore config
+            CORE.data[KEY_CORE] = TARGET_CONFIGURATIONS[0]
+        else:
+            # A static list is the same for every target configuration
+            for item in comp.auto_load:
                 add_item_to_components_graph(components_graph, item, name)
-        # restore config
-        CORE.data[KEY_CORE] = TARGET_CONFIGURATIONS[0]
 
-        for platform_path in path.iterdir():
-            platform_name = platform_path.stem
+        with os.scandir(path) as entries:
+            platform_names = [os.path.splitext(entry.name)[0] for entry in entries]
+
+        for platform_name in platform_names:
             if platform_name == name or platform_name not in platforms:
                 continue
             platform = get_platform(platform_name, name)
@@ -136,30 +147,32 @@ def create_components_graph():
                     components_graph, dependency.split(".")[0], name
                 )
 
-            for target_config in TARGET_CONFIGURATIONS:
-                CORE.data[KEY_CORE] = target_config
-                for item in resolve_auto_load(platform.auto_load, config={}):
+            if callable(platform.auto_load):
+                for target_config in TARGET_CONFIGURATIONS:
+                    CORE.data[KEY_CORE] = target_config
+                    for item in resolve_auto_load(platform.auto_load, config={}):
+                        add_item_to_components_graph(components_graph, item, name)
+                # restore config
+                CORE.data[KEY_CORE] = TARGET_CONFIGURATIONS[0]
+            else:
+                for item in platform.auto_load:
                     add_item_to_components_graph(components_graph, item, name)
-            # restore config
-            CORE.data[KEY_CORE] = TARGET_CONFIGURATIONS[0]
 
     return components_graph
 
 
-def find_children_of_component(components_graph, component_name, depth=0):
-    if component_name not in components_graph:
-        return []
+def find_children_of_component(components_graph, component_name):
+    # Walk the graph iteratively, visiting each component once
+    children = set()
+    stack = [component_name]
 
-    children = []
+    while stack:
+        for child in components_graph.get(stack.pop(), ()):
+            if child not in children:
+                children.add(child)
+                stack.append(child)
 
-    for child in components_graph[component_name]:
-        children.append(child)
-        if depth < 10:
-            children.extend(
-                find_children_of_component(components_graph, child, depth + 1)
-            )
-    # Remove duplicate values
-    return list(set(children))
+    return list(children)
 
 
 def get_components(files: list[str], get_dependencies: bool = False):
@@ -244,7 +257,7 @@ def main():
             # Only look at changed component files (ignore infrastructure changes)
             # For --changed-direct: only actual component code changes matter (for isolation)
             # For --changed-with-deps: only actual component code changes matter (for testing)
-            files = [f for f in changed if filter_component_files(f)]
+            files = [f for f in changed if f.startswith(_COMPONENT_PREFIXES)]
     else:
         # Get all component files
         files = get_all_component_files()
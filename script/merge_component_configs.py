@@ -16,7 +16,6 @@ The merger handles:
 from __future__ import annotations
 
 import argparse
-from functools import lru_cache
 from pathlib import Path
 import re
 import sys
@@ -33,6 +32,9 @@ from script.analyze_component_buses import PACKAGE_DEPENDENCIES, get_common_bus_
 # Used to mark packages that are included transitively (e.g., uart via modbus)
 DEPENDENCY_MARKER_PREFIX = "_dep_"
 
+# Matches both ${substitution} and $substitution references
+_SUBSTITUTION_RE = re.compile(r"\$\{?(\w+)\}?")
+
 
 def load_yaml_file(yaml_file: Path) -> dict:
     """Load YAML file using ESPHome's YAML loader.
@@ -49,35 +51,9 @@ def load_yaml_file(yaml_file: Path) -> dict:
     return yaml_util.load_yaml(yaml_file)
 
 
-@lru_cache(maxsize=256)
-def get_component_packages(
-    component_name: str, platform: str, tests_dir_str: str
-) -> dict:
-    """Get packages dict from a component's test file with caching.
-
-    This function is cached to avoid re-loading and re-parsing the same file
-    multiple times when extracting packages during cross-bus merging.
-
-    Args:
-        component_name: Name of the component
-        platform: Platform name (e.g., "esp32-idf")
-        tests_dir_str: String path to tests/components directory (must be string for cache hashability)
-
-    Returns:
-        Dictionary with 'packages' key containing the raw packages dict from the YAML,
-        or empty dict if no packages section exists
-    """
-    tests_dir = Path(tests_dir_str)
-    test_file = tests_dir / component_name / f"test.{platform}.yaml"
-    comp_data = load_yaml_file(test_file)
-
-    if "packages" not in comp_data or not isinstance(comp_data["packages"], dict):
-        return {}
-
-    return comp_data["packages"]
-
-
-def extract_packages_from_yaml(data: dict) -> dict[str, str]:
+def extract_packages_from_yaml(
+    data: dict, common_bus_packages: frozenset[str] | None = None
+) -> dict[str, str]:
     """Extract COMMON BUS package includes from parsed YAML.
 
     Only extracts packages that are from test_build_components/common/,
@@ -85,6 +61,7 @@ def extract_packages_from_yaml(data: dict) -> dict[str, str]:
 
     Args:
         data: Parsed YAML dictionary
+        common_bus_packages: Common bus package names, looked up if not given
 
     Returns:
         Dictionary mapping package name to include path (as string representation)
@@ -98,8 +75,8 @@ def extract_packages_from_yaml(data: dict) -> dict[str, str]:
         # List format doesn't include common bus packages (those use dict format)
         return {}
 
-    # Get common bus package names (cached)
-    common_bus_packages = get_common_bus_packages()
+    if common_bus_packages is None:
+        common_bus_packages = get_common_bus_packages()
     packages = {}
 
     # Dictionary format: packages: {name: value}
@@ -109,9 +86,7 @@ def extract_packages_from_yaml(data: dict) -> dict[str, str]:
             continue
         packages[name] = str(value)
         # Also track package dependencies (e.g., modbus includes uart)
-        if name not in PACKAGE_DEPENDENCIES:
-            continue
-        for dep in PACKAGE_DEPENDENCIES[name]:
+        for dep in PACKAGE_DEPENDENCIES.get(name, ()):
             if dep not in common_bus_packages:
                 continue
             # Mark as included via dependency
@@ -136,6 +111,9 @@ def prefix_substitutions_in_dict(
     if exclude is None:
         exclude = set()
 
+    # Always use braced format in output for consistency
+    sub_prefix = f"${{{prefix}_"
+
     def replace_sub(text: str) -> str:
         """Replace substitution references in a string."""
 
@@ -143,11 +121,12 @@ def prefix_substitutions_in_dict(
             sub_name = match.group(1)
             if sub_name in exclude:
                 return match.group(0)
-            # Always use braced format in output for consistency
-            return f"${{{prefix}_{sub_name}}}"
+            return sub_prefix + sub_name + "}"
 
-        # Match both ${substitution} and $substitution formats
-        return re.sub(r"\$\{?(\w+)\}?", replace_match, text)
+        # Most strings contain no substitution at all
+        if "$" not in text:
+            return text
+        return _SUBSTITUTION_RE.sub(replace_match, text)
 
     if isinstance(data, dict):
         result = {}
@@ -172,12 +151,12 @@ def deduplicate_by_id(data: dict) -> dict:
         data: Parsed config dictionary
 
     Returns:
-        Config with deduplicated lists
+        The same config, with duplicate list items removed
     """
     if not isinstance(data, dict):
         return data
 
-    result = {}
+    # Deduplicate in place; lists are only replaced when duplicates are found
     for key, value in data.items():
         if isinstance(value, list):
             # Check for items with 'id' field
@@ -187,22 +166,18 @@ def deduplicate_by_id(data: dict) -> dict:
             for item in value:
                 if isinstance(item, dict) and "id" in item:
                     item_id = item["id"]
-                    if item_id not in seen_ids:
-                        seen_ids.add(item_id)
-                        deduped_list.append(item)
-                    # else: skip duplicate ID (keep first occurrence)
-                else:
-                    # No ID, just add it
-                    deduped_list.append(item)
+                    if item_id in seen_ids:
+                        continue  # Skip duplicate ID (keep first occurrence)
+                    seen_ids.add(item_id)
+                deduped_list.append(item)
 
-            result[key] = deduped_list
+            if len(deduped_list) != len(value):
+                data[key] = deduped_list
         elif isinstance(value, dict):
             # Recursively deduplicate nested dicts
-            result[key] = deduplicate_by_id(value)
-        else:
-            result[key] = value
+            deduplicate_by_id(value)
 
-    return result
+    return data
 
 
 def merge_component_configs(
@@ -228,8 +203,12 @@ def merge_component_configs(
     # Start with empty config
     merged_config_data = {}
 
-    # Convert tests_dir to string for caching
-    tests_dir_str = str(tests_dir)
+    # Raw packages dict of each component's test file, kept to rebuild the
+    # merged packages section without re-loading the files
+    component_packages: dict[str, dict] = {}
+
+    # Get common bus package names once for all components
+    common_bus_packages = get_common_bus_packages()
 
     # Process each component
     for comp_name in component_names:
@@ -245,7 +224,7 @@ def merge_component_configs(
         # Merge packages from all components (cross-bus merging)
         # Components can have different packages (e.g., one with ble, another with uart)
         # as long as they don't conflict (checked by are_buses_compatible before calling this)
-        comp_packages = extract_packages_from_yaml(comp_data)
+        comp_packages = extract_packages_from_yaml(comp_data, common_bus_packages)
 
         if all_packages is None:
             # First component - initialize package dict
@@ -281,10 +260,9 @@ def merge_component_configs(
         # Expand packages - but we'll restore substitution priority after
         if "packages" in comp_data:
             packages_value = comp_data["packages"]
-
             if isinstance(packages_value, dict):
+                component_packages[comp_name] = packages_value
                 # Dict format - check each package
-                common_bus_packages = get_common_bus_packages()
                 for pkg_name, pkg_value in list(packages_value.items()):
                     if pkg_name in common_bus_packages:
                         continue
@@ -332,10 +310,9 @@ def merge_component_configs(
     if all_packages:
         # Build packages dict from merged all_packages
         # all_packages is a dict mapping package_name -> str(package_value)
-        # We need to reconstruct the actual package values by loading them from any component
+        # We need to reconstruct the actual package values from any component
         # Since packages with the same name must have identical configs (verified above),
-        # we can load the package value from the first component that has each package
-        common_bus_packages = get_common_bus_packages()
+        # we can take the package value from the first component that has each package
         merged_packages: dict[str, Any] = {}
 
         # Collect packages that are included as dependencies
@@ -360,11 +337,8 @@ def merge_component_configs(
                 continue
 
             # Find a component that has this package and extract its value
-            # Uses cached lookup to avoid re-loading the same files
             for comp_name in component_names:
-                comp_packages = get_component_packages(
-                    comp_name, platform, tests_dir_str
-                )
+                comp_packages = component_packages.get(comp_name, {})
                 if pkg_name in comp_packages:
                     merged_packages[pkg_name] = comp_packages[pkg_name]
                     break
@@ -40,24 +40,6 @@ GROUPABLE_WEIGHT = 1
 ALL_PLATFORMS = "all"
 
 
-def has_test_files(component_name: str, tests_dir: Path) -> bool:
-    """Check if a component has test files.
-
-    Args:
-        component_name: Name of the component
-        tests_dir: Path to tests/components directory
-
-    Returns:
-        True if the component has test.*.yaml files
-    """
-    component_dir = tests_dir / component_name
-    if not component_dir.exists() or not component_dir.is_dir():
-        return False
-
-    # Check for test.*.yaml files
-    return any(component_dir.glob("test.*.yaml"))
-
-
 def create_intelligent_batches(
     components: list[str],
     tests_dir: Path,
@@ -77,11 +59,16 @@ def create_intelligent_batches(
         - batches: List of component batches (lists of component names)
         - signature_groups: Dict mapping (platform, signature) to component lists
     """
+    # Analyze all components to get their bus signatures
+    # This walks every component test directory once, so it also tells us
+    # which components have test.*.yaml files
+    component_buses, non_groupable, _direct_bus_components = analyze_all_components(
+        tests_dir
+    )
+
     # Filter out components without test files
     # Platform components like 'climate' and 'climate_ir' don't have test files
-    components_with_tests = [
-        comp for comp in components if has_test_files(comp, tests_dir)
-    ]
+    components_with_tests = [comp for comp in components if comp in component_buses]
 
     # Log filtered components to stderr for debugging
     if len(components_with_tests) < len(components):
@@ -92,37 +79,29 @@ def create_intelligent_batches(
             file=sys.stderr,
         )
 
-    # Analyze all components to get their bus signatures
-    component_buses, non_groupable, _direct_bus_components = analyze_all_components(
-        tests_dir
-    )
-
     # Group components by their bus signature ONLY (ignore platform)
     # All platforms will be tested by test_build_components.py for each batch
     # Key: (platform, signature), Value: list of components
     # We use ALL_PLATFORMS since batching is platform-agnostic
     signature_groups: dict[tuple[str, str], list[str]] = defaultdict(list)
 
+    # Components that can't be grouped get unique signatures
+    # This includes:
+    # - Manually curated ISOLATED_COMPONENTS
+    # - Automatically detected non_groupable components
+    # - Directly changed components (passed via --isolate in CI)
+    # These can share a batch/runner but won't be grouped/merged
+    isolated = non_groupable.union(ISOLATED_COMPONENTS, directly_changed or ())
+
     for component in components_with_tests:
-        # Components that can't be grouped get unique signatures
-        # This includes:
-        # - Manually curated ISOLATED_COMPONENTS
-        # - Automatically detected non_groupable components
-        # - Directly changed components (passed via --isolate in CI)
-        # These can share a batch/runner but won't be grouped/merged
-        is_isolated = (
-            component in ISOLATED_COMPONENTS
-            or component in non_groupable
-            or (directly_changed and component in directly_changed)
-        )
-        if is_isolated:
+        if component in isolated:
             signature_groups[
                 (ALL_PLATFORMS, f"{ISOLATED_SIGNATURE_PREFIX}{component}")
             ].append(component)
             continue
 
         # Get signature from any platform (they should all have the same buses)
-        # Components not in component_buses were filtered out by has_test_files check
+        # Components not in component_buses were filtered out above
         comp_platforms = component_buses[component]
         for platform, buses in comp_platforms.items():
             if buses:
@@ -268,10 +247,7 @@ def main() -> int:
 
     # Print summary to stderr so it shows in CI logs
     # Count actual components being batched
-    actual_components = sum(len(batch.split()) for batch in batch_strings)
-
-    # Re-analyze to get isolated component counts for summary
-    _, non_groupable, _ = analyze_all_components(args.tests_dir)
+    actual_components = sum(map(len, batches))
 
     # Show grouping details
     print("\n=== Component Grouping Details ===", file=sys.stderr)
@@ -326,14 +302,8 @@ def main() -> int:
             print(f"  {', '.join(chunk)}", file=sys.stderr)
 
     # Count isolated vs groupable components
-    all_batched_components = [comp for batch in batches for comp in batch]
-    isolated_count = sum(
-        1
-        for comp in all_batched_components
-        if comp in ISOLATED_COMPONENTS
-        or comp in non_groupable
-        or (directly_changed and comp in directly_changed)
-    )
+    # Every isolated component was given its own isolated signature group
+    isolated_count = sum(len(comps) for _, comps in isolated_groups)
     groupable_count = actual_components - isolated_count
 
     print("\n=== Intelligent Batch Summary ===", file=sys.stderr)
@@ -342,16 +312,16 @@ def main() -> int:
 
     # Show breakdown of directly changed vs dependencies
     if directly_changed:
-        direct_count = sum(
-            1 for comp in all_batched_components if comp in directly_changed
-        )
-        dep_count = actual_components - direct_count
-        direct_comps = [
-            comp for comp in all_batched_components if comp in directly_changed
-        ]
-        dep_comps = [
-            comp for comp in all_batched_components if comp not in directly_changed
-        ]
+        direct_comps = []
+        dep_comps = []
+        for batch in batches:
+            for comp in batch:
+                if comp in directly_changed:
+                    direct_comps.append(comp)
+                else:
+                    dep_comps.append(comp)
+        direct_count = len(direct_comps)
+        dep_count = len(dep_comps)
         print(
             f"  - Direct changes: {direct_count} ({', '.join(sorted(direct_comps))})",
             file=sys.stderr,